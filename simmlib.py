@@ -21,6 +21,9 @@ import subprocess
 import time
 import glob
 import json
+import locale
+import contextlib
+import mmap
 import datetime
 import pandas as pd
 from LoggerInit import LoggerInit
@@ -308,19 +311,58 @@ def parse_dbl():
                 error_dir_list.add(os.path.expandvars(
                     line.split('=')[1].replace('$/','/')))
                 
+def get_tags(file_name,tags):
+    """
+    returns a dict with the first line in the file that contains each tag,
+    the file is memory mapped and scanned once, stopping when all the tags
+    are found
+    """
+    app_logger=logger.get_logger("get_tags")
+    pending={tag:tag.encode() for tag in tags}
+    result={tag:"" for tag in tags}
+    if not pending or os.path.getsize(file_name)==0:
+        return result
+    with open(file_name,'rb') as file:
+        with contextlib.closing(mmap.mmap(file.fileno(),0,
+            access=mmap.ACCESS_READ)) as mm:
+            size=len(mm)
+            start=0
+            #first position of each tag at or after start, a tag is only
+            #searched again once start has moved past its cached position
+            found={}
+            while pending and start<size:
+                for tag,btag in list(pending.items()):
+                    if found.get(tag,-1)<start:
+                        found[tag]=mm.find(btag,start)
+                        if found[tag]==-1:
+                            del pending[tag]
+                            del found[tag]
+                if not found:
+                    break
+                pos=min(found.values())
+                line_start=mm.rfind(b'\n',0,pos)+1
+                line_end=mm.find(b'\n',pos)
+                if line_end==-1:
+                    line_end=size
+                raw=mm[line_start:line_end].rstrip(b'\r')
+                #same text as reading the file in text mode did, python 2
+                #keeps the byte string and python 3 uses the locale encoding
+                line=raw
+                if not isinstance(line,str):
+                    line=line.decode(locale.getpreferredencoding(False),
+                        'replace')
+                for tag in [tag for tag,btag in pending.items() if btag in raw]:
+                    result[tag]=line
+                    del pending[tag]
+                    del found[tag]
+                start=line_end+1
+    return result
+
 def get_tag(file_name,tag):
     """
     resurns the line in the file that contains the tag
     """
-    app_logger=logger.get_logger("get_tag")
-    result=""
-    with open(file_name,'r') as file:
-        filedata=file.read().split("\n")
-        for line in filedata:
-            if tag in line:
-                result=line
-                break
-    return result
+    return get_tags(file_name,[tag])[tag]
 
 def get_column(file_name,column):
     """
@@ -357,8 +399,19 @@ def get_keys():
     NE_NAME=configuration['NE_NAME']
     rd_file_list=glob.glob(os.path.join(LOCAL_DIR,MASK))
     #get datetime
+    #only DATETIME is read from the tag lines for now
+    tag_list=[]
+    if rd_file_list and configuration['DATETIME']['source'].lower()=="tag":
+        if 'tag' not in configuration['DATETIME']:
+            app_logger.error('Missing tag in DATETIME configuration {conf}'\
+                .format(conf=configuration['DATETIME']))
+            quit()
+        tag_list.append(configuration['DATETIME']['tag'])
     for file_name in rd_file_list:
         function_list=[]
+        tag_lines={}
+        if tag_list:
+            tag_lines=get_tags(file_name,tag_list)
         if configuration['DATETIME']['source'].lower()=="filename":
             bfile_name=os.path.basename(file_name)
             function_list.append(\
@@ -367,7 +420,7 @@ def get_keys():
             )
 
         elif configuration['DATETIME']['source'].lower()=="tag":
-            line=get_tag(file_name,configuration['DATETIME']['tag'])
+            line=tag_lines[configuration['DATETIME']['tag']]
             function_list.append(
                 configuration['DATETIME']['function']\
                     .replace('input',"'"+line+"'")